@@ -1,7 +1,8 @@
 import sys
-import unittest
+from itertools import product
 from os.path import dirname as up
 
+import pytest
 # noinspection PyProtectedMember
 from numpy.testing import assert_equal
 from pyod.models.knn import KNN
@@ -16,32 +17,32 @@ path = up(up(up(__file__)))
 sys.path.append(path)
 
 
-class TestCPD(unittest.TestCase):
-    def setUp(self):
-        self.n_train = 200
-        self.n_test = 100
-        self.contamination = 0.1
-        self.X_train, self.X_test, self.y_train, self.y_test = generate_data(
-            n_train=self.n_train, n_test=self.n_test,
-            contamination=self.contamination, random_state=42)
+class TestCPD:
+    methods = ['Dynp', 'KernelCPD', 'Binseg', 'BottomUp']
+    transforms = ['cdf', 'kde']
 
-        self.clf = KNN()
-        self.clf.fit(self.X_train)
+    @classmethod
+    def setup_class(cls):
+        cls.n_train = 200
+        cls.n_test = 100
+        cls.contamination = 0.1
+        cls.X_train, cls.X_test, cls.y_train, cls.y_test = generate_data(
+            n_train=cls.n_train, n_test=cls.n_test,
+            contamination=cls.contamination, random_state=42)
 
-        self.scores = self.clf.decision_scores_
-        self.methods = ['Dynp', 'KernelCPD', 'Binseg', 'BottomUp']
-        self.transforms = ['cdf', 'kde']
+        cls.clf = KNN()
+        cls.clf.fit(cls.X_train)
 
-    def test_prediction_labels(self):
+        cls.scores = cls.clf.decision_scores_
 
-        for method in self.methods:
-            for transform in self.transforms:
+    @pytest.mark.parametrize('method, transform', list(product(methods, transforms)))
+    def test_prediction_labels(self, method, transform):
 
-                self.thres = CPD(method=method, transform=transform)
-                pred_labels = self.thres.eval(self.scores)
-                assert (self.thres.thresh_ is not None)
+        self.thres = CPD(method=method, transform=transform)
+        pred_labels = self.thres.eval(self.scores)
+        assert (self.thres.thresh_ is not None)
 
-                assert_equal(pred_labels.shape, self.y_train.shape)
+        assert_equal(pred_labels.shape, self.y_train.shape)
 
-                assert (pred_labels.min() == 0)
-                assert (pred_labels.max() == 1)
+        assert (pred_labels.min() == 0)
+        assert (pred_labels.max() == 1)
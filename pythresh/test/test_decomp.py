@@ -3,11 +3,13 @@ import unittest
 from os.path import dirname as up
 
 # noinspection PyProtectedMember
-from numpy.testing import assert_equal
+from numpy.testing import assert_allclose, assert_equal
 from pyod.models.knn import KNN
 from pyod.utils.data import generate_data
+from sklearn.decomposition import NMF, PCA
 
 from pythresh.thresholds.decomp import DECOMP
+from pythresh.thresholds.thresh_utility import gen_cdf, normalize
 
 # temporary solution for relative imports in case pyod is not installed
 # if pythresh is installed, no need to use the following line
@@ -43,3 +45,19 @@ class TestDECOMP(unittest.TestCase):
 
             assert (pred_labels.min() == 0)
             assert (pred_labels.max() == 1)
+
+    def test_closed_forms(self):
+
+        val, _ = gen_cdf(normalize(self.scores), 0, 1, len(self.scores)*3)
+        val = normalize(val).reshape(-1, 1)
+
+        for method, model in [('PCA', PCA(random_state=1234)),
+                              ('NMF', NMF(random_state=1234))]:
+
+            dec = model.fit_transform(val)
+            limit = 1-dec.max() if dec.max() > 0.5 else dec.max()
+
+            self.thres = DECOMP(method=method)
+            self.thres.eval(self.scores)
+
+            assert_allclose(self.thres.thresh_, limit, rtol=1e-6)
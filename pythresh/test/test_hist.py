@@ -3,7 +3,8 @@ import unittest
 from os.path import dirname as up
 
 # noinspection PyProtectedMember
-from numpy.testing import assert_equal
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
 from pyod.models.knn import KNN
 from pyod.utils.data import generate_data
 
@@ -46,3 +47,16 @@ class TestHIST(unittest.TestCase):
 
                 assert (pred_labels.min() == 0)
                 assert (pred_labels.max() == 1)
+
+    def test_isodata_ties(self):
+
+        # Tied histograms where the bin window test sits on a boundary
+        tied = [([0, 0.1, 0.9, 1], 3, 1/6),
+                ([0, 0.1, 0.3, 0.35, 0.5, 0.9, 0.95, 1], 5, 0.3)]
+
+        for decision, nbins, thresh in tied:
+
+            self.thres = HIST(method='isodata', nbins=nbins)
+            self.thres.eval(np.array(decision))
+
+            assert_allclose(self.thres.thresh_, thresh)
@@ -3,7 +3,9 @@ import unittest
 from os.path import dirname as up
 
 # noinspection PyProtectedMember
-from numpy.testing import assert_equal
+import numpy as np
+import scipy.stats as stats
+from numpy.testing import assert_allclose, assert_equal
 from pyod.models.knn import KNN
 from pyod.utils.data import generate_data
 
@@ -40,3 +42,32 @@ class TestMCST(unittest.TestCase):
 
         assert (pred_labels.min() == 0)
         assert (pred_labels.max() == 1)
+
+    def test_shapiro_pvalues(self):
+
+        rng = np.random.default_rng(42)
+
+        # Baseline sizes 3-11 and >11, inserted sizes 4-12 and >12
+        for n in list(range(3, 12)) + [12, 30, 200]:
+
+            decision = rng.random(n)**2
+            rnd = rng.random(n)
+
+            p_std, p_check = self.thres._shapiro_pvalues(decision, rnd)
+
+            assert_allclose(p_std, stats.shapiro(decision).pvalue,
+                            rtol=1e-6)
+            assert_allclose(p_check, [stats.shapiro(np.append(decision, r)).pvalue
+                                      for r in rnd], rtol=1e-6)
+
+        # Sample size 3 uses its own exact p-value
+        for _ in range(5):
+
+            res = stats.shapiro(rng.random(3))
+            assert_allclose(self.thres._shapiro_pvalue(res.statistic, 3),
+                            res.pvalue, rtol=1e-6)
+
+    def test_shapiro_large_warning(self):
+
+        with self.assertWarns(UserWarning):
+            self.thres._shapiro_pvalues(np.random.rand(5000), np.random.rand(2))
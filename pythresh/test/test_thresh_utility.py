@@ -0,0 +1,77 @@
+import sys
+import unittest
+from os.path import dirname as up
+
+# noinspection PyProtectedMember
+import numpy as np
+import scipy.stats as stats
+from numpy.testing import assert_allclose, assert_equal
+from pyod.models.knn import KNN
+from pyod.utils.data import generate_data
+from sklearn.utils import check_array
+
+from pythresh.thresholds import thresh_utility
+from pythresh.thresholds.thresh_utility import check_scores, gen_kde, normalize
+
+# temporary solution for relative imports in case pythresh is not installed
+# if pythresh is installed, no need to use the following line
+
+path = up(up(up(__file__)))
+sys.path.append(path)
+
+
+class TestGenKDE(unittest.TestCase):
+    def setUp(self):
+        self.n_train = 200
+        self.n_test = 100
+        self.contamination = 0.1
+        self.X_train, self.X_test, self.y_train, self.y_test = generate_data(
+            n_train=self.n_train, n_test=self.n_test,
+            contamination=self.contamination, random_state=42)
+
+        self.clf = KNN()
+        self.clf.fit(self.X_train)
+
+        self.scores = normalize(self.clf.decision_scores_)
+        self.size = len(self.scores)*3
+
+        kde = stats.gaussian_kde(self.scores)
+        self.dat_range = np.linspace(0, 1, self.size)
+        self.val = kde(self.dat_range)
+
+        thresh_utility._gen_kde.cache_clear()
+
+    def test_gen_kde(self):
+
+        val, dat_range = gen_kde(self.scores, 0, 1, self.size)
+
+        assert_equal(dat_range, self.dat_range)
+        assert_allclose(val, self.val, rtol=1e-12)
+
+        # Repeated calls reuse the cache but return fresh arrays
+        val[:] = 0
+        val, _ = gen_kde(self.scores, 0, 1, self.size)
+
+        assert_allclose(val, self.val, rtol=1e-12)
+
+
+class TestCheckScores(unittest.TestCase):
+
+    def test_fast_path(self):
+
+        scores = np.random.rand(10)
+
+        assert (check_scores(scores) is scores)
+
+    def test_invalid_shapes(self):
+
+        # Empty, 0-d and 3D inputs must fail as in check_array
+        for scores in [np.array([]), np.array(0.5), np.random.rand(2, 2, 2)]:
+
+            with self.assertRaises((ValueError, TypeError)) as expected:
+                check_array(scores, ensure_2d=False)
+
+            with self.assertRaises(type(expected.exception)) as raised:
+                check_scores(scores)
+
+            assert_equal(str(raised.exception), str(expected.exception))
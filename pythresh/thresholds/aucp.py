@@ -1,9 +1,7 @@
 import numpy as np
-from sklearn.metrics import auc
-from sklearn.utils import check_array
 
 from .base import BaseThresholder
-from .thresh_utility import cut, gen_kde, normalize
+from .thresh_utility import check_scores, cut, gen_kde, normalize
 
 
 class AUCP(BaseThresholder):
@@ -70,7 +68,7 @@ class AUCP(BaseThresholder):
             fitted model. 0 stands for inliers and 1 for outliers.
         """
 
-        decision = check_array(decision, ensure_2d=False)
+        decision = check_scores(decision)
 
         decision = normalize(decision)
 
@@ -78,23 +76,23 @@ class AUCP(BaseThresholder):
         val, dat_range = gen_kde(decision, 0, 1, len(decision)*2)
         val = normalize(val)
 
+        # Get the cumulative area under the curve from the start of
+        # the data range to each point
+        cum_area = np.append(0.0, np.cumsum(
+            0.5*(val[:-1] + val[1:])*np.diff(dat_range)))
+
         # Get the total area under the curve
-        tot_area = auc(dat_range, val)
+        tot_area = cum_area[-1]
 
         # Get area percentage limit
         mean = np.mean(decision)
         perc = mean+abs(mean-np.median(decision))
 
         # Apply the limit to where the area is less than that limit percentage
-        # of the total area under the curve
-        limit = 1
-        for i in range(len(dat_range)):
-
-            splt_area = auc(dat_range[i:], val[i:])
-
-            if splt_area < perc*tot_area:
-                limit = dat_range[i]
-                break
+        # of the total area under the curve, the remaining area is
+        # non-increasing so the first such point can be searched for
+        idx = np.searchsorted(cum_area, (1 - perc)*tot_area, side='right')
+        limit = dat_range[idx] if idx < len(dat_range) else 1
 
         self.thresh_ = limit
 
@@ -1,13 +1,11 @@
 import numpy as np
-from sklearn.decomposition import NMF, PCA
 from sklearn.random_projection import (
     GaussianRandomProjection,
     SparseRandomProjection
 )
-from sklearn.utils import check_array
 
 from .base import BaseThresholder
-from .thresh_utility import cut, gen_cdf, normalize
+from .thresh_utility import check_scores, cut, gen_cdf, normalize
 
 
 class DECOMP(BaseThresholder):
@@ -32,7 +30,8 @@ class DECOMP(BaseThresholder):
             - 'SRP':  Sparse Random Projection
 
        random_state : int, optional (default=1234)
-            Random seed for the decomposition algorithm. Can also be set to None.
+            Random seed for the GRP and SRP random projections. PCA and NMF
+            are deterministic. Can also be set to None.
 
        Attributes
        ----------
@@ -69,9 +68,7 @@ class DECOMP(BaseThresholder):
     def __init__(self, method='PCA', random_state=1234):
 
         self.method = method
-        self.method_funcs = {'NMF': NMF(random_state=random_state),
-                             'PCA': PCA(random_state=random_state),
-                             'GRP': GaussianRandomProjection(n_components=2,
+        self.method_funcs = {'GRP': GaussianRandomProjection(n_components=2,
                                                              random_state=random_state),
                              'SRP': SparseRandomProjection(n_components=3,
                                                            random_state=random_state)}
@@ -93,7 +90,7 @@ class DECOMP(BaseThresholder):
             fitted model. 0 stands for inliers and 1 for outliers.
         """
 
-        decision = check_array(decision, ensure_2d=False)
+        decision = check_scores(decision)
 
         decision = normalize(decision)
 
@@ -102,8 +99,22 @@ class DECOMP(BaseThresholder):
         val = normalize(val)
 
         # Apply decomposition
-        dec = self.method_funcs[str(self.method)].fit_transform(
-            val.reshape(-1, 1))
+        if self.method == 'PCA':
+
+            # PCA of a single feature only centers it, with the sign
+            # flipped so that the largest absolute value is positive
+            dec = val - np.mean(val)
+            dec *= np.sign(dec[np.argmax(np.abs(dec))])
+
+        elif self.method == 'NMF':
+
+            # A non-negative single feature is exactly rank one, the
+            # NNDSVD start W = val/sqrt(|val|), H = sqrt(|val|) is optimal
+            dec = val / np.sqrt(np.linalg.norm(val))
+
+        else:
+            dec = self.method_funcs[str(self.method)].fit_transform(
+                val.reshape(-1, 1))
 
         # Set limit to max value from decomposition matrix
         limit = np.max(dec)
@@ -1,8 +1,8 @@
 import numpy as np
-from sklearn.utils import check_array
+from numba import njit
 
 from .base import BaseThresholder
-from .thresh_utility import cut, gen_kde, normalize
+from .thresh_utility import check_scores, cut, gen_kde, normalize
 
 
 class FGD(BaseThresholder):
@@ -53,31 +53,49 @@ class FGD(BaseThresholder):
             fitted model. 0 stands for inliers and 1 for outliers.
         """
 
-        decision = check_array(decision, ensure_2d=False)
+        decision = check_scores(decision)
 
         decision = normalize(decision)
 
         # Generate KDE
         val, dat_range = gen_kde(decision, 0, 1, len(decision)*3)
 
-        # Calculate the first derivative of the KDE with respect
-        # to the data range
-        deriv = np.gradient(val, dat_range[1]-dat_range[0])
+        # Find the first two inflection points of the KDE
+        ind = self._inflections(val, dat_range[1]-dat_range[0])
 
+        limit = ((dat_range[ind[0]]+dat_range[ind[1]])/2 if
+                 len(ind) > 1 else 1.1)
+        self.thresh_ = limit
+
+        return cut(decision, limit)
+
+    @staticmethod
+    @njit(cache=True, fastmath=True)
+    def _inflections(val, dx):
+        """Find the first two indices where the gradient of val turns non-positive."""
+
+        n = len(val)
+        ind = np.full(2, -1)
         count = 0
-        ind = []
 
-        # Find the first two inflection points
-        for i in range(len(deriv)-1):
+        # Calculate the first derivative of the KDE with respect to the
+        # data range (as np.gradient) while scanning for where it turns
+        # from positive to non-positive
+        prev = (val[1] - val[0]) / dx
 
-            if (deriv[i] > 0) & (deriv[i+1] <= 0):
+        for i in range(1, n):
+
+            if i < n - 1:
+                curr = (val[i+1] - val[i-1]) / (2 * dx)
+            else:
+                curr = (val[i] - val[i-1]) / dx
+
+            if (prev > 0) & (curr <= 0):
+                ind[count] = i - 1
                 count += 1
-                ind.append(i)
                 if count == 2:
                     break
 
-        limit = ((dat_range[ind[0]]+dat_range[ind[1]])/2 if
-                 len(ind) > 1 else 1.1)
-        self.thresh_ = limit
+            prev = curr
 
-        return cut(decision, limit)
+        return ind[:count]
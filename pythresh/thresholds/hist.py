@@ -1,9 +1,9 @@
 import numpy as np
+from numba import njit
 from scipy import ndimage as ndi
-from sklearn.utils import check_array
 
 from .base import BaseThresholder
-from .thresh_utility import normalize
+from .thresh_utility import check_scores, normalize
 
 # https://github.com/scikit-image/scikit-image/blob/v0.19.2/skimage/filters/thresholding.py
 
@@ -66,7 +66,7 @@ class HIST(BaseThresholder):
             fitted model. 0 stands for inliers and 1 for outliers.
         """
 
-        decision = check_array(decision, ensure_2d=False)
+        decision = check_scores(decision)
 
         decision = normalize(decision)
 
@@ -78,7 +78,12 @@ class HIST(BaseThresholder):
         bin_centers, counts = self._histogram(decision, self.nbins)
 
         # Threshold histogram
-        if self.method != 'li':
+        if self.method in ['otsu', 'yen', 'isodata']:
+            sums = self._hist_sums(bin_centers, counts)
+            threshold = self.method_funcs[str(
+                self.method)](bin_centers, counts, sums)
+
+        elif self.method != 'li':
             threshold = self.method_funcs[str(
                 self.method)](bin_centers, counts)
 
@@ -106,31 +111,50 @@ class HIST(BaseThresholder):
     def _find_local_maxima_idx(self, hist):
         """Find the local maxima in histogram."""
 
-        maximum_idxs = []
-        direction = 1
+        # Keep the nonzero steps so plateaus take the direction they had
+        steps = np.flatnonzero(np.diff(hist))
+        falling = hist[steps + 1] < hist[steps]
+
+        # A maximum is a fall preceded by a rise (or by nothing)
+        rising = np.append(True, ~falling[:-1])
+
+        return steps[falling & rising]
+
+    def _hist_sums(self, bin_centers, counts):
+        """Cumulative counts and score intensities from both histogram ends."""
+
+        counts = counts.astype(np.float64)
+        bin_width = bin_centers[1] - bin_centers[0]
+
+        # Cumulate intensities in bin index space, where the sums are
+        # exact, then map onto the evenly spaced bin centers
+        index_counts = counts * np.arange(len(counts))
+
+        # Counts and intensities of each bin and lower
+        weight1 = np.cumsum(counts)
+        index_sum1 = np.cumsum(index_counts)
+
+        # Counts and intensities of each bin and higher
+        weight2 = weight1[-1] - weight1 + counts
+        index_sum2 = index_sum1[-1] - index_sum1 + index_counts
 
-        for i in range(hist.shape[0] - 1):
-            if direction > 0:
-                if hist[i + 1] < hist[i]:
-                    direction = -1
-                    maximum_idxs.append(i)
-            elif hist[i + 1] > hist[i]:
-                direction = 1
+        csum1 = bin_centers[0] * weight1 + bin_width * index_sum1
+        csum2 = bin_centers[0] * weight2 + bin_width * index_sum2
 
-        return maximum_idxs
+        return weight1, weight2, csum1, csum2
 
-    def _OTSU_thres(self, bin_centers, counts):
+    def _OTSU_thres(self, bin_centers, counts, sums=None):
         """Otsu's method for histogram based thresholding."""
 
-        counts = counts.astype(float)
+        if sums is None:
+            sums = self._hist_sums(bin_centers, counts)
 
         # class probabilities for all possible thresholds
-        weight1 = np.cumsum(counts)
-        weight2 = np.cumsum(counts[::-1])[::-1]
+        weight1, weight2, csum1, csum2 = sums
 
         # class means for all possible thresholds
-        mean1 = np.cumsum(counts * bin_centers) / weight1
-        mean2 = (np.cumsum((counts * bin_centers)[::-1]) / weight2[::-1])[::-1]
+        mean1 = csum1 / weight1
+        mean2 = csum2 / weight2
 
         # Clip ends to align class 1 and class 2 variables:
         variance12 = weight1[:-1] * weight2[1:] * (mean1[:-1] - mean2[1:])**2
@@ -139,12 +163,17 @@ class HIST(BaseThresholder):
 
         return bin_centers[idx]
 
-    def _YEN_thres(self, bin_centers, counts):
+    def _YEN_thres(self, bin_centers, counts, sums=None):
         """Yen's method for histogram based thresholding."""
 
+        if sums is None:
+            sums = self._hist_sums(bin_centers, counts)
+
+        weight1 = sums[0]
+
         # Calculate probability mass function
-        pmf = counts.astype(np.float32) / counts.sum()
-        P1 = np.cumsum(pmf)
+        pmf = counts / weight1[-1]
+        P1 = weight1 / weight1[-1]
         P1_sq = np.cumsum(pmf ** 2)
 
         # Get cumsum calculated from end of squared array:
@@ -156,17 +185,20 @@ class HIST(BaseThresholder):
 
         return bin_centers[crit.argmax()]
 
-    def _ISODATA_thres(self, bin_centers, counts):
+    def _ISODATA_thres(self, bin_centers, counts, sums=None):
         """ISODATA method for histogram based thresholding."""
 
-        counts = counts.astype(np.float32)
+        if sums is None:
+            sums = self._hist_sums(bin_centers, counts)
 
         # csuml and csumh contain the count of pixels in that bin or lower, and
         # in all bins strictly higher than that bin, respectively
-        csuml = np.cumsum(counts)
+        csuml = sums[0]
         csumh = csuml[-1] - csuml
 
-        # intensity_sum contains the total score intensity from each bin
+        # intensity_sum contains the total score intensity from each bin,
+        # summed in score space as the bin window test below is sensitive
+        # to the rounding of exact ties
         intensity_sum = counts * bin_centers
 
         # Get the lower and higher average value of all scores in that bin or lower, and
@@ -194,6 +226,21 @@ class HIST(BaseThresholder):
 
         tolerance = np.min(np.diff(np.unique(decision)))/2
         t_next = np.mean(decision)  # initial new guess for iteration
+
+        return self._li_iter(bin_centers, counts, tolerance, t_next)
+
+    @staticmethod
+    @njit(cache=True)
+    def _li_iter(bin_centers, counts, tolerance, t_next):
+        """Iterate Li's minimum cross entropy threshold to convergence."""
+
+        # Cumulative counts and intensities to read the weighted
+        # class means at any split of the sorted bin centers
+        csum_w = np.zeros(len(counts) + 1)
+        csum_w[1:] = np.cumsum(counts)
+        csum_i = np.zeros(len(counts) + 1)
+        csum_i[1:] = np.cumsum(counts * bin_centers)
+
         t_curr = -2 * tolerance  # initial old guess for iteration
 
         # Iterate until the new and old thresholds difference
@@ -201,14 +248,12 @@ class HIST(BaseThresholder):
         while abs(t_next - t_curr) > tolerance:
 
             t_curr = t_next
-            outlier = bin_centers > t_curr
-            inlier = ~outlier
+            split = np.searchsorted(bin_centers, t_curr, side='right')
 
-            mean_out = np.average(bin_centers[outlier],
-                                  weights=counts[outlier])
+            mean_out = ((csum_i[-1] - csum_i[split])
+                        / (csum_w[-1] - csum_w[split]))
 
-            mean_in = np.average(bin_centers[inlier],
-                                 weights=counts[inlier])
+            mean_in = csum_i[split] / csum_w[split]
 
             t_next = ((mean_in - mean_out)
                       / (np.log(mean_in) - np.log(mean_out)))
@@ -218,10 +263,11 @@ class HIST(BaseThresholder):
     def _Minimum_thres(self, bin_centers, counts):
         """Minimum method for histogram based thresholding."""
 
-        smooth_hist = counts.astype(np.float64, copy=False)
+        smooth_hist = counts.astype(np.float64)
 
+        # Smooth in place to avoid a new array on every iteration
         for _ in range(10000):
-            smooth_hist = ndi.uniform_filter1d(smooth_hist, 3)
+            ndi.uniform_filter1d(smooth_hist, 3, output=smooth_hist)
             maximum_idxs = self._find_local_maxima_idx(smooth_hist)
             if len(maximum_idxs) < 3:
                 break
@@ -235,24 +281,21 @@ class HIST(BaseThresholder):
     def _Triangle_thres(self, bin_centers, counts):
         """Triangle algorithm for histogram based thresholding."""
 
-        nbins = len(counts)
-
         # Find peak, lowest and highest score levels.
         arg_peak_height = np.argmax(counts)
         peak_height = counts[arg_peak_height]
         arg_low_level, arg_high_level = np.where(counts > 0)[0][[0, -1]]
 
-        # Flip is True if left tail is shorter.
+        # Flip is True if left tail is shorter, then walk the right tail
+        # down from the highest level instead of reversing the counts.
         flip = arg_peak_height - arg_low_level < arg_high_level - arg_peak_height
-        if flip:
-            counts = counts[::-1]
-            arg_low_level = nbins - arg_high_level - 1
-            arg_peak_height = nbins - arg_peak_height - 1
+        arg_start = arg_high_level if flip else arg_low_level
+        step = -1 if flip else 1
 
         # Set up the coordinate system.
-        width = arg_peak_height - arg_low_level
+        width = abs(arg_peak_height - arg_start)
         x1 = np.arange(width)
-        y1 = counts[x1 + arg_low_level]
+        y1 = counts[arg_start + step * x1]
 
         # Normalize.
         norm = np.sqrt(peak_height**2 + width**2)
@@ -261,8 +304,6 @@ class HIST(BaseThresholder):
 
         # Maximize the length.
         length = peak_height * x1 - width * y1
-        arg_level = np.argmax(length) + arg_low_level
-
-        arg_level = nbins - arg_level - 1 if flip else arg_level
+        arg_level = arg_start + step * np.argmax(length)
 
         return bin_centers[arg_level]
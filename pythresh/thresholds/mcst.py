@@ -1,9 +1,12 @@
+import warnings
+from functools import lru_cache
+
 import numpy as np
 import scipy.stats as stats
-from sklearn.utils import check_array
+from scipy.special import ndtri
 
 from .base import BaseThresholder
-from .thresh_utility import cut, normalize
+from .thresh_utility import check_scores, cut, normalize
 
 
 class MCST(BaseThresholder):
@@ -105,34 +108,131 @@ class MCST(BaseThresholder):
             fitted model. 0 stands for inliers and 1 for outliers.
         """
 
-        decision = check_array(decision, ensure_2d=False)
+        decision = check_scores(decision)
 
         decision = normalize(decision)
 
-        # Get Baseline Shapiro-Wilk test p-value
-        p_std = stats.shapiro(decision).pvalue
-
         # Create random dataset to insert and test p-values
         rnd = stats.uniform.rvs(loc=0, scale=1, size=len(
             decision), random_state=self.random_state)
         rnd = normalize(rnd)
-        povr = []
 
-        # Iterate and add a new random variable
-        # Perform a Shapiro-Wilk test and see if the new
-        # distribution has a lower or higher p-value
-        # If higher record these potential outlier values
-        for i in range(len(rnd)):
+        # Get Baseline Shapiro-Wilk test p-value and the p-values of the
+        # decision scores with each random value added, sharing the sort
+        p_std, p_check = self._shapiro_pvalues(decision, rnd)
+
+        # Go through the added random variables in order and see if
+        # the new distribution has a higher p-value than the baseline
+        # and all the previous ones, if so these are potential outliers
+        p_max = np.empty(len(p_check))
+        p_max[0] = p_std
+        np.maximum.accumulate(p_check[:-1], out=p_max[1:])
+        np.maximum(p_max, p_std, out=p_max)
+
+        # Take the minimum recorded value in one reduction, defaulting
+        # to 1.1 if none were recorded
+        limit = np.min(rnd, where=p_check > p_max, initial=1.1)
+        self.thresh_ = limit
+
+        return cut(decision, limit)
 
-            arr = np.append(decision, rnd[i])
-            p_check = stats.shapiro(arr).pvalue
+    def _shapiro_pvalues(self, decision, rnd):
+        """Shapiro-Wilk p-values of decision alone and with each rnd value."""
 
-            if p_check > p_std:
+        n = len(decision)
 
-                p_std = p_check
-                povr.append(rnd[i])
+        if n < 3:
+            raise ValueError('Data must be at least length 3.')
 
-        limit = np.min(povr) if povr else 1.1
-        self.thresh_ = limit
+        if n + 1 > 5000:
+            warnings.warn('Shapiro-Wilk p-values may not be accurate for N > 5000. '
+                          f'Current N is {n + 1}.', stacklevel=3)
 
-        return cut(decision, limit)
+        # Center on the decision mean, W is shift invariant
+        shift = np.mean(decision)
+        srt = np.sort(decision) - shift
+        rnd = rnd - shift
+
+        a = self._shapiro_coefs(n + 1)
+
+        # Partial sums of the coefficients times the sorted scores before
+        # and after each possible insertion position
+        lower = np.zeros(n + 1)
+        upper = np.zeros(n + 1)
+        np.cumsum(a[:-1] * srt, out=lower[1:])
+        np.cumsum((a[1:] * srt)[::-1], out=upper[-2::-1])
+
+        pos = np.searchsorted(srt, rnd)
+        ax = lower[pos] + a[pos] * rnd + upper[pos]
+
+        ssx = np.sum(srt**2) + rnd**2 - (np.sum(srt) + rnd)**2 / (n + 1)
+        w = ax**2 / (np.sum(a**2) * ssx)
+
+        # Baseline statistic from the same sorted scores
+        a_std = self._shapiro_coefs(n)
+        w_std = np.dot(a_std, srt)**2 / (np.sum(a_std**2) * np.sum(srt**2))
+
+        return self._shapiro_pvalue(w_std, n), self._shapiro_pvalue(w, n + 1)
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _shapiro_coefs(n):
+        """Shapiro-Wilk coefficients for a sample of size n (AS R94)."""
+
+        nn2 = n // 2
+
+        if n == 3:
+            half = np.array([np.sqrt(0.5)])
+
+        else:
+            m = ndtri((np.arange(1, nn2 + 1) - 0.375) / (n + 0.25))
+            summ2 = 2 * np.sum(m**2)
+            rsn = 1 / np.sqrt(n)
+
+            c1 = [-2.706056, 4.434685, -2.07119, -.147981, .221157, 0.]
+            c2 = [-3.582633, 5.682633, -1.752461, -.293762, .042981, 0.]
+
+            a1 = np.polyval(c1, rsn) - m[0] / np.sqrt(summ2)
+
+            if n > 5:
+                a2 = np.polyval(c2, rsn) - m[1] / np.sqrt(summ2)
+                fac = np.sqrt((summ2 - 2 * m[0]**2 - 2 * m[1]**2)
+                              / (1 - 2 * a1**2 - 2 * a2**2))
+                half = -m / fac
+                half[:2] = a1, a2
+
+            else:
+                fac = np.sqrt((summ2 - 2 * m[0]**2) / (1 - 2 * a1**2))
+                half = -m / fac
+                half[0] = a1
+
+        a = np.zeros(n)
+        a[:nn2] = -half
+        a[n - nn2:] = half[::-1]
+
+        # Shared between calls through the cache
+        a.flags.writeable = False
+
+        return a
+
+    def _shapiro_pvalue(self, w, n):
+        """Shapiro-Wilk p-values for W statistics of sample size n (AS R94)."""
+
+        if n == 3:
+            return np.maximum(6 / np.pi * (np.arcsin(np.sqrt(w)) - np.pi / 3), 0)
+
+        w1 = np.log1p(-w)
+
+        if n <= 11:
+            gamma = np.polyval([.459, -2.273], n)
+            small = w1 >= gamma
+            w1 = -np.log(np.where(small, np.nan, gamma - w1))
+            m = np.polyval([-6.714e-4, .025054, -.39978, .544], n)
+            s = np.exp(np.polyval([-.0020322, .062767, -.77857, 1.3822], n))
+
+            return np.where(small, 1e-99, stats.norm.sf((w1 - m) / s))
+
+        m = np.polyval([.0038915, -.083751, -.31082, -1.5861], np.log(n))
+        s = np.exp(np.polyval([.0030302, -.082676, -.4803], np.log(n)))
+
+        return stats.norm.sf((w1 - m) / s)
@@ -1,6 +1,9 @@
+from functools import lru_cache
+
 import numpy as np
 import scipy.stats as stats
 from scipy.special import ndtr
+from sklearn.utils import check_array
 
 
 def normalize(data):
@@ -8,6 +11,18 @@ def normalize(data):
     return ((data - data.min()) / (data.max() - data.min()))
 
 
+def check_scores(decision):
+
+    # Skip the full validation for scores that are already
+    # a non-empty, 1D, finite and contiguous float64 array
+    if (isinstance(decision, np.ndarray) and (decision.dtype == np.float64)
+            and (decision.ndim == 1) and (decision.size > 0)
+            and decision.flags.c_contiguous and np.isfinite(decision).all()):
+        return decision
+
+    return check_array(decision, ensure_2d=False)
+
+
 def cut(decision, limit):
 
     labels = np.zeros(len(decision), dtype=int)
@@ -19,6 +34,31 @@ def cut(decision, limit):
 
 def gen_kde(data, lower, upper, size):
 
+    val, dat_range = _gen_kde(*_array_key(data), lower, upper, size)
+
+    return val.copy(), dat_range.copy()
+
+
+def gen_cdf(data, lower, upper, size):
+
+    cdf, dat_range = _gen_cdf(*_array_key(data), lower, upper, size)
+
+    return cdf.copy(), dat_range.copy()
+
+
+def _array_key(data):
+
+    # Hashable form of the data to reuse KDEs across repeated calls
+    data = np.ascontiguousarray(data)
+
+    return data.tobytes(), data.dtype.str, data.shape
+
+
+@lru_cache(maxsize=8)
+def _gen_kde(buffer, dtype, shape, lower, upper, size):
+
+    data = np.frombuffer(buffer, dtype=dtype).reshape(shape)
+
     # Create a KDE of the data
     kde = stats.gaussian_kde(data)
     dat_range = np.linspace(lower, upper, size)
@@ -26,7 +66,10 @@ def gen_kde(data, lower, upper, size):
     return kde(dat_range), dat_range
 
 
-def gen_cdf(data, lower, upper, size):
+@lru_cache(maxsize=8)
+def _gen_cdf(buffer, dtype, shape, lower, upper, size):
+
+    data = np.frombuffer(buffer, dtype=dtype).reshape(shape)
 
     # Create a KDE & CDF of the data
     kde = stats.gaussian_kde(data)